@@ -1,11 +1,68 @@
 """LangChain callbacks for AVP credential auditing."""
 
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterable, List, MutableSequence, Optional, Tuple, Union
+from collections import deque, namedtuple
+from datetime import datetime, timezone
+from itertools import islice
+import os
+import pickle
+import threading
+import time
 
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_core.outputs import LLMResult
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return (json.dumps(obj, default=str) + "\n").encode()
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+AuditEntry = namedtuple("AuditEntry", "timestamp event run_id metadata")
+
+# Result of AVPCredentialCallback.tail_audit_log: new entries plus the offset
+# to pass as `since` on the next call.
+AuditView = namedtuple("AuditView", "entries next_offset")
+
+# (epoch day, "YYYY-MM-DDT" prefix) of the last formatted day. Always read and
+# replaced as one tuple so concurrent formatters never mix day and prefix.
+_DAY_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format an epoch timestamp as an ISO 8601 UTC string with millisecond precision."""
+    global _DAY_CACHE
+    ms = int(timestamp * 1000)
+    day, ms = divmod(ms, 86_400_000)
+    cached_day, prefix = _DAY_CACHE
+    if day != cached_day:
+        prefix = datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%dT")
+        _DAY_CACHE = (day, prefix)
+    secs, ms = divmod(ms, 1000)
+    mins, secs = divmod(secs, 60)
+    hours, mins = divmod(mins, 60)
+    return f"{prefix}{hours:02d}:{mins:02d}:{secs:02d}.{ms:03d}Z"
+
+
+def _extract_model_and_provider(serialized: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the (provider, model) names from a serialized LLM."""
+    kw = serialized.get("kwargs")
+    model = kw.get("model", "unknown") if kw else "unknown"
+    ids = serialized.get("id")
+    provider = ids[-1] if ids else "unknown"
+    return provider, model
+
 
 class AVPCredentialCallback(BaseCallbackHandler):
     """
@@ -20,27 +77,39 @@ class AVPCredentialCallback(BaseCallbackHandler):
         >>> print(callback.get_audit_log())
     """
 
-    def __init__(self, credential_provider: Any = None):
+    # BaseCallbackHandler does not define __slots__, so instances keep a
+    # __dict__; the slots still give the hot attributes fixed offsets.
+    __slots__ = ("credential_provider", "_max_entries", "_audit_log", "_logged", "_lock")
+
+    def __init__(self, credential_provider: Any = None, max_entries: Optional[int] = None):
         """
         Initialize the callback handler.
 
         Args:
             credential_provider: Optional AVPCredentialProvider for logging.
+            max_entries: Optional cap on retained audit entries. When set, the
+                log becomes a ring buffer that keeps only the newest entries.
         """
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
         self.credential_provider = credential_provider
-        self._audit_log: List[Dict[str, Any]] = []
-        self._current_run: Optional[str] = None
-
-    def _log(self, event: str, metadata: Optional[Dict[str, Any]] = None):
-        """Log an event to the audit log."""
-        entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "event": event,
-            "run_id": self._current_run,
-        }
-        if metadata:
-            entry["metadata"] = metadata
-        self._audit_log.append(entry)
+        self._max_entries = max_entries
+        self._audit_log: MutableSequence[AuditEntry] = self._new_log()
+        self._logged = 0
+        self._lock = threading.Lock()
+
+    def _new_log(self) -> MutableSequence[AuditEntry]:
+        """Create empty audit log storage, bounded if max_entries is set."""
+        if self._max_entries is None:
+            return []
+        return deque(maxlen=self._max_entries)
+
+    def _log_event(self, event: str, run_id: Any, **metadata: Any):
+        """Log an event for a run, using the keyword arguments as metadata."""
+        entry = AuditEntry(time.time(), event, str(run_id) if run_id else None, metadata or None)
+        with self._lock:
+            self._audit_log.append(entry)
+            self._logged += 1
 
     def on_llm_start(
         self,
@@ -51,17 +120,15 @@ class AVPCredentialCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Called when LLM starts running."""
-        self._current_run = str(run_id) if run_id else None
+        provider, model = _extract_model_and_provider(serialized)
 
-        # Extract model info
-        model = serialized.get("kwargs", {}).get("model", "unknown")
-        provider = serialized.get("id", ["unknown"])[-1] if serialized.get("id") else "unknown"
-
-        self._log("llm_start", {
-            "provider": provider,
-            "model": model,
-            "prompt_count": len(prompts),
-        })
+        self._log_event(
+            "llm_start",
+            run_id,
+            provider=provider,
+            model=model,
+            prompt_count=len(prompts),
+        )
 
     def on_llm_end(
         self,
@@ -75,11 +142,12 @@ class AVPCredentialCallback(BaseCallbackHandler):
         if response.llm_output:
             token_usage = response.llm_output.get("token_usage", {})
 
-        self._log("llm_end", {
-            "generations": len(response.generations),
-            "token_usage": token_usage,
-        })
-        self._current_run = None
+        self._log_event(
+            "llm_end",
+            run_id,
+            generations=len(response.generations),
+            token_usage=token_usage,
+        )
 
     def on_llm_error(
         self,
@@ -89,26 +157,195 @@ class AVPCredentialCallback(BaseCallbackHandler):
         **kwargs: Any,
     ) -> None:
         """Called when LLM errors."""
-        self._log("llm_error", {
-            "error": str(error),
-            "error_type": type(error).__name__,
-        })
-        self._current_run = None
+        self._log_event(
+            "llm_error",
+            run_id,
+            error=str(error),
+            error_type=type(error).__name__,
+        )
+
+    @staticmethod
+    def _entry_dict(entry: AuditEntry) -> Dict[str, Any]:
+        """Convert an audit entry to its public dict form."""
+        item = {
+            "timestamp": _format_timestamp(entry.timestamp),
+            "event": entry.event,
+            "run_id": entry.run_id,
+        }
+        if entry.metadata is not None:
+            item["metadata"] = entry.metadata
+        return item
+
+    def _snapshot(self, since: int = 0) -> Tuple[List[AuditEntry], int]:
+        """Retained entries logged at or after an offset, and the current offset."""
+        with self._lock:
+            log = self._audit_log
+            start = max(since - (self._logged - len(log)), 0)
+            if isinstance(log, list):
+                return log[start:], self._logged
+            # Deques index in O(n); walk back from the newest entry instead.
+            entries = list(islice(reversed(log), len(log) - start))
+            entries.reverse()
+            return entries, self._logged
+
+    def get_audit_log(self, since: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get the audit log.
+
+        Args:
+            since: Offset of the first entry to return, as previously obtained
+                from tail_audit_log. Defaults to the whole retained log.
+        """
+        entries, _ = self._snapshot(since)
+        return [self._entry_dict(entry) for entry in entries]
+
+    def tail_audit_log(self, since: int = 0) -> AuditView:
+        """
+        Get the entries logged since an offset, for incremental consumers.
+
+        Offsets count every event ever logged by this handler, so they stay
+        valid across clear_audit_log() and when max_entries drops old entries.
+
+        Args:
+            since: The next_offset returned by the previous call, or 0.
+
+        Returns:
+            AuditView of the new entries and the offset to pass next time.
+
+        Example:
+            >>> view = callback.tail_audit_log()
+            >>> upload(view.entries)
+            >>> view = callback.tail_audit_log(view.next_offset)
+        """
+        entries, next_offset = self._snapshot(since)
+        return AuditView([self._entry_dict(entry) for entry in entries], next_offset)
+
+    def to_jsonl(self) -> bytes:
+        """
+        Serialize the audit log as JSON Lines.
 
-    def get_audit_log(self) -> List[Dict[str, Any]]:
-        """Get the full audit log."""
-        return self._audit_log.copy()
+        Uses orjson when installed and falls back to the standard json module.
+
+        Returns:
+            One JSON object per audit entry, newline-terminated, as bytes.
+        """
+        entries, _ = self._snapshot()
+        return b"".join(_dumps(self._entry_dict(entry)) for entry in entries)
+
+    def write_jsonl(self, path: Union[str, "os.PathLike[str]"], since: int = 0) -> int:
+        """
+        Append the entries logged since an offset to a JSON Lines file.
+
+        Pass the returned offset back on the next call so each entry is
+        written exactly once.
+
+        Args:
+            path: Destination file. Created if it does not exist.
+            since: Offset returned by the previous call, or 0.
+
+        Returns:
+            The offset to pass as `since` next time.
+
+        Example:
+            >>> offset = callback.write_jsonl("audit.jsonl")
+            >>> offset = callback.write_jsonl("audit.jsonl", offset)
+        """
+        entries, next_offset = self._snapshot(since)
+        data = b"".join(_dumps(self._entry_dict(entry)) for entry in entries)
+        with open(path, "ab") as f:
+            f.write(data)
+        return next_offset
+
+    def to_msgpack(self) -> bytes:
+        """
+        Serialize the audit log as MessagePack.
+
+        Each entry is packed as a [timestamp, event, run_id, metadata] array
+        with the raw epoch timestamp. Requires the msgpack package.
+
+        Returns:
+            The packed audit log.
+        """
+        if msgpack is None:
+            raise ImportError("Install msgpack: pip install msgpack")
+        entries, _ = self._snapshot()
+        return msgpack.packb(entries, use_bin_type=True, default=str)
+
+    @classmethod
+    def from_msgpack(cls, data: bytes, **kwargs: Any) -> "AVPCredentialCallback":
+        """
+        Create a callback handler holding an audit log produced by to_msgpack.
+
+        Args:
+            data: Bytes returned by to_msgpack.
+            **kwargs: Arguments passed to the constructor.
+
+        Returns:
+            AVPCredentialCallback with the unpacked entries.
+        """
+        if msgpack is None:
+            raise ImportError("Install msgpack: pip install msgpack")
+        entries = [AuditEntry(*entry) for entry in msgpack.unpackb(data, raw=False)]
+        callback = cls(**kwargs)
+        callback._audit_log.extend(entries)
+        callback._logged = len(entries)
+        return callback
+
+    def dump_pickle(self, file: BinaryIO) -> List[pickle.PickleBuffer]:
+        """
+        Pickle the audit log to a file using protocol 5 out-of-band buffers.
+
+        Metadata values that support out-of-band pickling (pickle.PickleBuffer,
+        NumPy arrays, ...) are not copied into the stream; their buffers are
+        returned and must be passed to load_pickle. Intended for trusted local
+        storage only: never load pickles from an untrusted source.
+
+        Args:
+            file: Binary file object to write the pickle stream to.
+
+        Returns:
+            The out-of-band buffers, in the order load_pickle expects them.
+        """
+        entries, _ = self._snapshot()
+        buffers: List[pickle.PickleBuffer] = []
+        pickle.Pickler(file, protocol=5, buffer_callback=buffers.append).dump(entries)
+        return buffers
+
+    @classmethod
+    def load_pickle(
+        cls,
+        file: BinaryIO,
+        buffers: Iterable[Any] = (),
+        **kwargs: Any,
+    ) -> "AVPCredentialCallback":
+        """
+        Create a callback handler holding an audit log written by dump_pickle.
+
+        Args:
+            file: Binary file object containing the pickle stream.
+            buffers: The buffers returned by dump_pickle.
+            **kwargs: Arguments passed to the constructor.
+
+        Returns:
+            AVPCredentialCallback with the unpickled entries.
+        """
+        entries = pickle.Unpickler(file, buffers=buffers).load()
+        callback = cls(**kwargs)
+        callback._audit_log.extend(entries)
+        callback._logged = len(entries)
+        return callback
 
     def clear_audit_log(self):
         """Clear the audit log."""
-        self._audit_log = []
+        with self._lock:
+            self._audit_log = self._new_log()
 
     def print_audit_log(self):
         """Print the audit log in a readable format."""
         print("\nLangChain-AVP Audit Log:")
         print("-" * 60)
-        for entry in self._audit_log:
-            meta = entry.get("metadata", {})
-            meta_str = ", ".join(f"{k}={v}" for k, v in meta.items())
-            print(f"  {entry['timestamp']} | {entry['event']}: {meta_str}")
+        entries, _ = self._snapshot()
+        for timestamp, event, _, metadata in entries:
+            meta_str = ", ".join(f"{k}={v}" for k, v in (metadata or {}).items())
+            print(f"  {_format_timestamp(timestamp)} | {event}: {meta_str}")
         print("-" * 60)
@@ -1,13 +1,58 @@
 """AVP Credential Provider for LangChain."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Literal, Tuple, Union
 from pathlib import Path
+from types import MappingProxyType
 import getpass
+import os
+import time
 
-from avp import AVPClient
+from avp import AVPClient, SecretNotFoundError
 from avp.backends import FileBackend, MemoryBackend
 
 
+# Provider name to credential name mapping used by get_api_key.
+_API_KEY_MAPPING = MappingProxyType({
+    "anthropic": "anthropic_api_key",
+    "openai": "openai_api_key",
+    "cohere": "cohere_api_key",
+    "huggingface": "huggingface_api_key",
+    "google": "google_api_key",
+    "mistral": "mistral_api_key",
+})
+
+# Keyring service name under which vault passwords are stored.
+_KEYRING_SERVICE = "langchain-avp"
+
+# Vault passwords already entered in this process, keyed by absolute vault path.
+_PASSWORD_CACHE: Dict[str, str] = {}
+
+
+def _forget_password(key: str, password_cache: str) -> None:
+    """Remove a vault password, keyed by absolute vault path, from a password cache."""
+    if password_cache == "process":
+        _PASSWORD_CACHE.pop(key, None)
+    elif password_cache == "keyring":
+        import keyring
+        from keyring.errors import KeyringError
+
+        try:
+            keyring.delete_password(_KEYRING_SERVICE, key)
+        except KeyringError:
+            pass
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    """Encode a credential value, passing UTF-8 bytes through unchanged."""
+    if not isinstance(value, bytes):
+        return value.encode()
+    try:
+        value.decode()
+    except UnicodeDecodeError:
+        raise ValueError("Credential bytes must be valid UTF-8")
+    return value
+
+
 class AVPCredentialProvider:
     """
     Credential provider that integrates AVP with LangChain.
@@ -20,12 +65,25 @@ class AVPCredentialProvider:
         >>> llm = ChatAnthropic(api_key=api_key)
     """
 
+    __slots__ = (
+        "_workspace",
+        "_client",
+        "_session_id",
+        "_backend",
+        "_cache",
+        "_cache_ttl",
+        "_vault_key",
+        "_password_cache",
+    )
+
     def __init__(
         self,
         vault_path: Optional[str] = None,
         password: Optional[str] = None,
         workspace: str = "langchain",
         backend: Optional[Any] = None,
+        cache_ttl: Optional[float] = 60.0,
+        password_cache: Literal["none", "process", "keyring"] = "process",
     ):
         """
         Initialize the AVP credential provider.
@@ -35,58 +93,197 @@ class AVPCredentialProvider:
             password: Vault password. If None and vault_path is provided, will prompt.
             workspace: AVP workspace name for credential isolation.
             backend: Custom AVP backend. If provided, vault_path and password are ignored.
+            cache_ttl: Seconds a retrieved credential is served from memory before
+                the vault is queried again. None caches until invalidated.
+            password_cache: Where a vault password is remembered so later
+                providers for the same vault do not prompt again: "none",
+                "process" (prompted passwords, in memory for this process) or
+                "keyring" (the OS keyring via the keyring package, shared
+                across processes). See forget_password() and close().
         """
         self._workspace = workspace
         self._client: Optional[AVPClient] = None
         self._session_id: Optional[str] = None
+        self._cache: Dict[str, Tuple[float, str]] = {}
+        self._cache_ttl = cache_ttl
+        self._vault_key: Optional[str] = None
+        self._password_cache = password_cache
 
         if backend is not None:
             self._backend = backend
         elif vault_path is not None:
-            if password is None:
-                password = getpass.getpass(f"Enter password for {vault_path}: ")
-            self._backend = FileBackend(vault_path, password)
+            self._backend = self._open_file_backend(vault_path, password, password_cache)
+            self._vault_key = os.path.abspath(vault_path)
         else:
             self._backend = MemoryBackend()
 
         self._connect()
 
+    @staticmethod
+    def _open_file_backend(
+        vault_path: str,
+        password: Optional[str],
+        password_cache: str,
+    ) -> FileBackend:
+        """Open a file vault, reusing or remembering its password as configured."""
+        if password_cache not in ("none", "process", "keyring"):
+            raise ValueError(f"Unknown password_cache: {password_cache}")
+
+        key = os.path.abspath(vault_path)
+        keyring = None
+        if password_cache == "keyring":
+            try:
+                import keyring
+                from keyring.errors import KeyringError
+            except ImportError:
+                raise ImportError("Install keyring: pip install keyring")
+
+        cached = None
+        if password is None and password_cache == "process":
+            cached = _PASSWORD_CACHE.get(key)
+        elif password is None and keyring is not None:
+            # No usable keyring backend (headless hosts, CI) counts as a miss.
+            try:
+                cached = keyring.get_password(_KEYRING_SERVICE, key)
+            except KeyringError:
+                cached = None
+
+        if cached is not None:
+            try:
+                return FileBackend(vault_path, cached)
+            except Exception:
+                # Stale cached password; forget it rather than retrying forever.
+                _forget_password(key, password_cache)
+                raise
+
+        prompted = password is None
+        if prompted:
+            password = getpass.getpass(f"Enter password for {vault_path}: ")
+        backend = FileBackend(vault_path, password)
+
+        # Passwords the caller passed in are already held by the caller, so
+        # only prompted ones are kept in process memory.
+        if password_cache == "process" and prompted:
+            _PASSWORD_CACHE[key] = password
+        elif keyring is not None:
+            # Best effort: the vault is already open, so a keyring failure
+            # only means the next provider prompts again.
+            try:
+                keyring.set_password(_KEYRING_SERVICE, key, password)
+            except KeyringError:
+                pass
+        return backend
+
     def _connect(self):
         """Connect to the AVP vault."""
         self._client = AVPClient(self._backend)
         session = self._client.authenticate(workspace=self._workspace)
         self._session_id = session.session_id
 
-    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+    def _cached(self, name: str) -> Optional[str]:
+        """Return the cached value for a credential if it has not expired."""
+        cached = self._cache.get(name)
+        if cached is not None:
+            fetched_at, value = cached
+            if self._cache_ttl is None or time.monotonic() - fetched_at < self._cache_ttl:
+                return value
+        return None
+
+    def get(
+        self,
+        name: str,
+        default: Optional[str] = None,
+        strict: bool = False,
+    ) -> Optional[str]:
         """
         Get a credential from the vault.
 
         Args:
             name: Name of the credential.
             default: Default value if credential not found.
+            strict: If True, errors other than a missing credential (expired
+                session, decryption failure, backend errors) are raised instead
+                of returning default.
 
         Returns:
             The credential value or default.
         """
+        value = self._cached(name)
+        if value is not None:
+            return value
+
         try:
             result = self._client.retrieve(self._session_id, name)
-            return result.value.decode()
+            value = result.value.decode()
+        except SecretNotFoundError:
+            return default
         except Exception:
+            if strict:
+                raise
             return default
+        self._cache[name] = (time.monotonic(), value)
+        return value
+
+    def get_many(self, names: List[str]) -> Dict[str, str]:
+        """
+        Get several credentials from the vault.
+
+        Cached values are returned directly; the vault is listed once so that
+        only credentials that exist are retrieved.
 
-    def set(self, name: str, value: str, labels: Optional[Dict[str, str]] = None) -> None:
+        Args:
+            names: Names of the credentials.
+
+        Returns:
+            Mapping of credential name to value for the credentials found.
+        """
+        values: Dict[str, str] = {}
+        uncached = []
+        for name in dict.fromkeys(names):
+            value = self._cached(name)
+            if value is None:
+                uncached.append(name)
+            else:
+                values[name] = value
+
+        if uncached:
+            existing = self._existing_names()
+            for name in uncached:
+                if name in existing:
+                    value = self.get(name)
+                    if value is not None:
+                        values[name] = value
+
+        return values
+
+    def _existing_names(self) -> set:
+        """Names of all credentials in the workspace, following pagination."""
+        names = set()
+        cursor = None
+        while True:
+            result = self._client.list_secrets(self._session_id, cursor=cursor)
+            names.update(s.name for s in result.secrets)
+            if not result.has_more:
+                return names
+            cursor = result.cursor
+
+    def set(self, name: str, value: Union[str, bytes], labels: Optional[Dict[str, str]] = None) -> None:
         """
         Store a credential in the vault.
 
         Args:
             name: Name of the credential.
-            value: The credential value.
+            value: The credential value, as text or raw UTF-8 bytes.
             labels: Optional metadata labels.
+
+        Raises:
+            ValueError: If value is bytes that are not valid UTF-8.
         """
+        self._cache.pop(name, None)
         self._client.store(
             self._session_id,
             name,
-            value.encode(),
+            _to_bytes(value),
             labels=labels
         )
 
@@ -100,6 +297,7 @@ class AVPCredentialProvider:
         Returns:
             True if deleted, False if not found.
         """
+        self._cache.pop(name, None)
         result = self._client.delete(self._session_id, name)
         return result.deleted
 
@@ -116,15 +314,19 @@ class AVPCredentialProvider:
         result = self._client.list_secrets(self._session_id, filter_labels=labels)
         return [s.name for s in result.secrets]
 
-    def rotate(self, name: str, new_value: str) -> None:
+    def rotate(self, name: str, new_value: Union[str, bytes]) -> None:
         """
         Rotate a credential (update with version tracking).
 
         Args:
             name: Name of the credential.
-            new_value: New credential value.
+            new_value: New credential value, as text or raw UTF-8 bytes.
+
+        Raises:
+            ValueError: If new_value is bytes that are not valid UTF-8.
         """
-        self._client.rotate(self._session_id, name, new_value.encode())
+        self._cache.pop(name, None)
+        self._client.rotate(self._session_id, name, _to_bytes(new_value))
 
     def get_api_key(self, provider: str) -> Optional[str]:
         """
@@ -138,19 +340,41 @@ class AVPCredentialProvider:
         Returns:
             The API key or None.
         """
-        key_mapping = {
-            "anthropic": "anthropic_api_key",
-            "openai": "openai_api_key",
-            "cohere": "cohere_api_key",
-            "huggingface": "huggingface_api_key",
-            "google": "google_api_key",
-            "mistral": "mistral_api_key",
-        }
-        credential_name = key_mapping.get(provider.lower(), f"{provider.lower()}_api_key")
+        provider = provider.lower()
+        credential_name = _API_KEY_MAPPING.get(provider) or f"{provider}_api_key"
         return self.get(credential_name)
 
-    def close(self):
-        """Close the vault connection."""
+    def invalidate_cache(self, name: Optional[str] = None) -> None:
+        """
+        Drop cached credential values.
+
+        Args:
+            name: Credential to invalidate. If None, the whole cache is cleared.
+        """
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+    def forget_password(self) -> None:
+        """
+        Remove this vault's password from the configured password cache.
+
+        Later providers for the same vault will prompt for it again.
+        """
+        if self._vault_key is not None:
+            _forget_password(self._vault_key, self._password_cache)
+
+    def close(self, forget_password: bool = False):
+        """
+        Close the vault connection.
+
+        Args:
+            forget_password: Also remove the vault password from the password cache.
+        """
+        if forget_password:
+            self.forget_password()
+        self._cache.clear()
         if self._client:
             self._client.close()
 
@@ -1,11 +1,64 @@
 """Utility functions for LangChain-AVP integration."""
 
-from typing import Optional, Dict, Any, Type
+from typing import Optional, Dict, Any, Type, Callable
+import functools
 import os
 
 from langchain_avp.credential_provider import AVPCredentialProvider
 
 
+@functools.cache
+def _anthropic_cls() -> Type:
+    try:
+        from langchain_anthropic import ChatAnthropic
+    except ImportError:
+        raise ImportError("Install langchain-anthropic: pip install langchain-anthropic")
+    return ChatAnthropic
+
+
+@functools.cache
+def _openai_cls() -> Type:
+    try:
+        from langchain_openai import ChatOpenAI
+    except ImportError:
+        raise ImportError("Install langchain-openai: pip install langchain-openai")
+    return ChatOpenAI
+
+
+@functools.cache
+def _cohere_cls() -> Type:
+    try:
+        from langchain_cohere import ChatCohere
+    except ImportError:
+        raise ImportError("Install langchain-cohere: pip install langchain-cohere")
+    return ChatCohere
+
+
+@functools.cache
+def _mistral_cls() -> Type:
+    try:
+        from langchain_mistralai import ChatMistralAI
+    except ImportError:
+        raise ImportError("Install langchain-mistralai: pip install langchain-mistralai")
+    return ChatMistralAI
+
+
+# Provider name -> constructor taking (api_key, model, **kwargs).
+_FACTORIES: Dict[str, Callable[..., Any]] = {
+    "anthropic": lambda api_key, model, **kwargs: _anthropic_cls()(api_key=api_key, model=model, **kwargs),
+    "openai": lambda api_key, model, **kwargs: _openai_cls()(api_key=api_key, model=model, **kwargs),
+    "cohere": lambda api_key, model, **kwargs: _cohere_cls()(cohere_api_key=api_key, model=model, **kwargs),
+    "mistral": lambda api_key, model, **kwargs: _mistral_cls()(api_key=api_key, model=model, **kwargs),
+}
+
+_DEFAULT_MODELS: Dict[str, str] = {
+    "anthropic": "claude-3-haiku-20240307",
+    "openai": "gpt-3.5-turbo",
+    "cohere": "command",
+    "mistral": "mistral-small-latest",
+}
+
+
 def load_credentials(
     vault_path: str,
     password: Optional[str] = None,
@@ -39,10 +92,12 @@ def load_credentials(
     )
 
     if env_vars:
-        for env_name, cred_name in env_vars.items():
-            value = provider.get(cred_name)
-            if value:
-                os.environ[env_name] = value
+        values = provider.get_many(list(env_vars.values()))
+        os.environ.update({
+            env_name: values[cred_name]
+            for env_name, cred_name in env_vars.items()
+            if values.get(cred_name)
+        })
 
     return provider
 
@@ -75,57 +130,11 @@ def get_llm_with_avp(
         raise ValueError(f"No API key found for provider: {provider}")
 
     provider = provider.lower()
-
-    if provider == "anthropic":
-        try:
-            from langchain_anthropic import ChatAnthropic
-        except ImportError:
-            raise ImportError("Install langchain-anthropic: pip install langchain-anthropic")
-
-        return ChatAnthropic(
-            api_key=api_key,
-            model=model or "claude-3-haiku-20240307",
-            **kwargs,
-        )
-
-    elif provider == "openai":
-        try:
-            from langchain_openai import ChatOpenAI
-        except ImportError:
-            raise ImportError("Install langchain-openai: pip install langchain-openai")
-
-        return ChatOpenAI(
-            api_key=api_key,
-            model=model or "gpt-3.5-turbo",
-            **kwargs,
-        )
-
-    elif provider == "cohere":
-        try:
-            from langchain_cohere import ChatCohere
-        except ImportError:
-            raise ImportError("Install langchain-cohere: pip install langchain-cohere")
-
-        return ChatCohere(
-            cohere_api_key=api_key,
-            model=model or "command",
-            **kwargs,
-        )
-
-    elif provider == "mistral":
-        try:
-            from langchain_mistralai import ChatMistralAI
-        except ImportError:
-            raise ImportError("Install langchain-mistralai: pip install langchain-mistralai")
-
-        return ChatMistralAI(
-            api_key=api_key,
-            model=model or "mistral-small-latest",
-            **kwargs,
-        )
-
-    else:
+    factory = _FACTORIES.get(provider)
+    if factory is None:
         raise ValueError(
             f"Unknown provider: {provider}. "
-            f"Supported: anthropic, openai, cohere, mistral"
+            f"Supported: {', '.join(_FACTORIES)}"
         )
+
+    return factory(api_key, model or _DEFAULT_MODELS[provider], **kwargs)
@@ -0,0 +1,249 @@
+"""Tests for AVPCredentialCallback."""
+
+import asyncio
+import io
+import json
+import pickle
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+
+import pytest
+from langchain_core.language_models.fake import FakeListLLM
+from langchain_core.outputs import LLMResult
+
+from langchain_avp import AVPCredentialCallback
+from langchain_avp.callbacks import _format_timestamp
+
+
+class TestAVPCredentialCallback:
+    """Test suite for AVPCredentialCallback."""
+
+    def test_timestamp_format(self):
+        """Test timestamps are ISO 8601 UTC with millisecond precision."""
+        assert _format_timestamp(0) == "1970-01-01T00:00:00.000Z"
+        assert _format_timestamp(1700000000.9999) == "2023-11-14T22:13:20.999Z"
+
+        now = time.time()
+        parsed = datetime.strptime(_format_timestamp(now), "%Y-%m-%dT%H:%M:%S.%fZ")
+        expected = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None)
+        assert abs((expected - parsed).total_seconds()) < 0.001
+
+    def test_timestamp_format_concurrent_days(self):
+        """Test concurrent formatting of different days never mixes dates."""
+        days = [1700000000 + i * 86400 for i in range(4)]
+        expected = {ts: _format_timestamp(ts) for ts in days}
+        errors = []
+
+        def worker(ts):
+            for _ in range(2000):
+                if _format_timestamp(ts) != expected[ts]:
+                    errors.append(ts)
+
+        threads = [threading.Thread(target=worker, args=(ts,)) for ts in days]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_llm_start_logged(self):
+        """Test llm_start events are recorded."""
+        callback = AVPCredentialCallback()
+        callback.on_llm_start(
+            {"id": ["langchain", "ChatAnthropic"], "kwargs": {"model": "claude"}},
+            ["Hello"],
+            run_id="run-1",
+        )
+
+        log = callback.get_audit_log()
+        assert len(log) == 1
+        assert log[0]["event"] == "llm_start"
+        assert log[0]["run_id"] == "run-1"
+        assert log[0]["metadata"] == {
+            "provider": "ChatAnthropic",
+            "model": "claude",
+            "prompt_count": 1,
+        }
+
+    def test_unbounded_log_keeps_all_entries(self):
+        """Test the unbounded log keeps every entry."""
+        callback = AVPCredentialCallback()
+        for i in range(2500):
+            callback.on_llm_error(ValueError(str(i)))
+
+        log = callback.get_audit_log()
+        assert len(log) == 2500
+        assert log[0]["metadata"]["error"] == "0"
+        assert log[-1]["metadata"]["error"] == "2499"
+
+    def test_max_entries_keeps_newest(self):
+        """Test the bounded log drops the oldest entries."""
+        callback = AVPCredentialCallback(max_entries=3)
+        for i in range(5):
+            callback.on_llm_error(ValueError(str(i)))
+
+        errors = [e["metadata"]["error"] for e in callback.get_audit_log()]
+        assert errors == ["2", "3", "4"]
+
+        callback.clear_audit_log()
+        assert callback.get_audit_log() == []
+
+    def test_jsonl_export(self, tmp_path):
+        """Test the audit log serializes to JSON Lines."""
+        callback = AVPCredentialCallback()
+        callback.on_llm_error(ValueError("boom"))
+        callback.on_llm_error(KeyError("key"))
+
+        lines = callback.to_jsonl().splitlines()
+        assert [json.loads(line) for line in lines] == callback.get_audit_log()
+
+        path = tmp_path / "audit.jsonl"
+        offset = callback.write_jsonl(path)
+        assert offset == 2
+        assert callback.write_jsonl(path, offset) == 2
+        assert path.read_bytes() == callback.to_jsonl()
+
+        callback.on_llm_error(ValueError("later"))
+        assert callback.write_jsonl(path, offset) == 3
+        assert path.read_bytes() == callback.to_jsonl()
+
+    def test_tail_audit_log(self):
+        """Test incremental reads return only new entries."""
+        callback = AVPCredentialCallback(max_entries=3)
+        callback.on_llm_error(ValueError("0"))
+        callback.on_llm_error(ValueError("1"))
+
+        view = callback.tail_audit_log()
+        assert [e["metadata"]["error"] for e in view.entries] == ["0", "1"]
+        assert view.next_offset == 2
+
+        for i in range(2, 6):
+            callback.on_llm_error(ValueError(str(i)))
+        view = callback.tail_audit_log(view.next_offset)
+        assert [e["metadata"]["error"] for e in view.entries] == ["3", "4", "5"]
+
+        callback.clear_audit_log()
+        callback.on_llm_error(ValueError("6"))
+        view = callback.tail_audit_log(view.next_offset)
+        assert [e["metadata"]["error"] for e in view.entries] == ["6"]
+        assert view.next_offset == 7
+
+    def test_tail_audit_log_skips_old_entries(self):
+        """Test polling only touches entries newer than the offset."""
+
+        class NoIterList(list):
+            def __iter__(self):
+                raise AssertionError("walked the whole log")
+
+        class NoIterDeque(deque):
+            def __iter__(self):
+                raise AssertionError("walked the whole log")
+
+        for max_entries, storage in ((None, NoIterList), (100, NoIterDeque)):
+            callback = AVPCredentialCallback(max_entries=max_entries)
+            for i in range(50):
+                callback.on_llm_error(ValueError(str(i)))
+            callback._audit_log = (
+                storage(callback._audit_log)
+                if max_entries is None
+                else storage(callback._audit_log, maxlen=max_entries)
+            )
+
+            view = callback.tail_audit_log(50)
+            assert view == ([], 50)
+
+            callback.on_llm_error(ValueError("50"))
+            view = callback.tail_audit_log(50)
+            assert [e["metadata"]["error"] for e in view.entries] == ["50"]
+
+    def test_concurrent_runs(self):
+        """Test runs on different threads keep their own run ids."""
+        callback = AVPCredentialCallback()
+
+        def run(i):
+            callback.on_llm_start({"id": ["Chat"]}, ["prompt"], run_id=f"run-{i}")
+            callback.on_llm_error(ValueError(str(i)), run_id=f"run-{i}")
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        log = callback.get_audit_log()
+        assert len(log) == 16
+        for entry in log:
+            if entry["event"] == "llm_error":
+                assert entry["run_id"] == f"run-{entry['metadata']['error']}"
+
+    def test_run_ends_on_another_thread(self):
+        """Test a run started and ended on different threads is fully logged."""
+        callback = AVPCredentialCallback()
+        start = threading.Thread(
+            target=callback.on_llm_start,
+            args=({"id": ["Chat"]}, ["prompt"]),
+            kwargs={"run_id": "run-1"},
+        )
+        start.start()
+        start.join()
+        end = threading.Thread(
+            target=callback.on_llm_end,
+            args=(LLMResult(generations=[[]]),),
+            kwargs={"run_id": "run-1"},
+        )
+        end.start()
+        end.join()
+
+        log = callback.get_audit_log()
+        assert [e["event"] for e in log] == ["llm_start", "llm_end"]
+        assert [e["run_id"] for e in log] == ["run-1", "run-1"]
+
+    def test_async_invocations(self):
+        """Test concurrent async runs log every event with its run id."""
+        callback = AVPCredentialCallback()
+        llm = FakeListLLM(responses=["ok"])
+
+        async def main():
+            await asyncio.gather(*(
+                llm.ainvoke("prompt", config={"callbacks": [callback]})
+                for _ in range(10)
+            ))
+
+        asyncio.run(main())
+
+        log = callback.get_audit_log()
+        assert len(log) == 20
+        run_ids = [e["run_id"] for e in log]
+        assert None not in run_ids
+        for run_id in set(run_ids):
+            events = sorted(e["event"] for e in log if e["run_id"] == run_id)
+            assert events == ["llm_end", "llm_start"]
+
+    def test_msgpack_round_trip(self):
+        """Test the audit log survives a MessagePack round trip."""
+        pytest.importorskip("msgpack")
+        callback = AVPCredentialCallback()
+        callback.on_llm_start({"id": ["Chat"]}, ["prompt"], run_id="run-1")
+        callback.on_llm_error(ValueError("boom"))
+
+        restored = AVPCredentialCallback.from_msgpack(callback.to_msgpack())
+        assert restored.get_audit_log() == callback.get_audit_log()
+
+    def test_pickle_round_trip(self):
+        """Test the audit log survives a pickle round trip with out-of-band buffers."""
+        callback = AVPCredentialCallback()
+        callback.on_llm_start({"id": ["Chat"]}, ["prompt"], run_id="run-1")
+        callback._log_event("blob", "run-1", payload=pickle.PickleBuffer(bytearray(b"x" * 64)))
+        callback.on_llm_error(ValueError("boom"))
+
+        stream = io.BytesIO()
+        buffers = callback.dump_pickle(stream)
+        assert len(buffers) == 1
+
+        stream.seek(0)
+        restored = AVPCredentialCallback.load_pickle(stream, buffers)
+        log = restored.get_audit_log()
+        assert [e["event"] for e in log] == ["llm_start", "blob", "llm_error"]
+        assert bytes(log[1]["metadata"]["payload"]) == b"x" * 64
@@ -1,6 +1,11 @@
 """Tests for AVPCredentialProvider."""
 
+import getpass
+import sys
+import types
+
 import pytest
+from avp import BackendError
 from langchain_avp import AVPCredentialProvider
 
 
@@ -78,3 +83,182 @@ class TestAVPCredentialProvider:
         assert provider.get("rotate_key") == "v2"
 
         provider.close()
+
+    def test_get_is_cached(self):
+        """Test repeated gets are served from the cache."""
+        provider = AVPCredentialProvider()
+        provider.set("cached_key", "v1")
+
+        calls = []
+        retrieve = provider._client.retrieve
+
+        def counting_retrieve(*args, **kwargs):
+            calls.append(args)
+            return retrieve(*args, **kwargs)
+
+        provider._client.retrieve = counting_retrieve
+        assert provider.get("cached_key") == "v1"
+        assert provider.get("cached_key") == "v1"
+        assert len(calls) == 1
+
+        provider.invalidate_cache()
+        assert provider.get("cached_key") == "v1"
+        assert len(calls) == 2
+
+        provider.close()
+
+    def test_cache_ttl_expiry(self):
+        """Test cached values are refetched once the TTL elapses."""
+        provider = AVPCredentialProvider(cache_ttl=0)
+        provider.set("ttl_key", "v1")
+        assert provider.get("ttl_key") == "v1"
+
+        provider._client.store(provider._session_id, "ttl_key", b"v2")
+        assert provider.get("ttl_key") == "v2"
+
+        provider.close()
+
+    def test_get_many(self):
+        """Test batch retrieval of credentials."""
+        provider = AVPCredentialProvider()
+        provider.set("key_a", "a")
+        provider.set("key_b", "b")
+
+        assert provider.get_many(["key_a", "key_b", "missing"]) == {
+            "key_a": "a",
+            "key_b": "b",
+        }
+
+        provider.close()
+
+    def test_bytes_values(self):
+        """Test credentials can be stored and rotated as bytes."""
+        provider = AVPCredentialProvider()
+
+        provider.set("bytes_key", b"v1")
+        assert provider.get("bytes_key") == "v1"
+
+        provider.rotate("bytes_key", b"v2")
+        assert provider.get("bytes_key") == "v2"
+
+        with pytest.raises(ValueError):
+            provider.set("bad_key", b"\xff\xfe")
+        with pytest.raises(ValueError):
+            provider.rotate("bytes_key", b"\xff")
+        assert provider.get("bytes_key") == "v2"
+
+        provider.close()
+
+    def test_password_process_cache(self, tmp_path, monkeypatch):
+        """Test a vault password is only prompted for once per process."""
+        vault_path = str(tmp_path / "vault.enc")
+        prompts = []
+
+        def fake_getpass(prompt):
+            prompts.append(prompt)
+            return "secret"
+
+        monkeypatch.setattr(getpass, "getpass", fake_getpass)
+
+        with AVPCredentialProvider(vault_path) as provider:
+            provider.set("file_key", "file_value")
+        with AVPCredentialProvider(vault_path) as provider:
+            assert provider.get("file_key") == "file_value"
+        assert len(prompts) == 1
+
+        with AVPCredentialProvider(vault_path, password_cache="none") as provider:
+            assert provider.get("file_key") == "file_value"
+        assert len(prompts) == 2
+
+        provider = AVPCredentialProvider(vault_path)
+        provider.close(forget_password=True)
+        assert len(prompts) == 2
+        AVPCredentialProvider(vault_path).close()
+        assert len(prompts) == 3
+
+    def test_password_keyring_cache(self, tmp_path, monkeypatch):
+        """Test vault passwords can be stored in and forgotten from the OS keyring."""
+        vault_path = str(tmp_path / "vault.enc")
+        store = {}
+
+        class KeyringError(Exception):
+            pass
+
+        class PasswordDeleteError(KeyringError):
+            pass
+
+        class NoKeyringError(KeyringError):
+            pass
+
+        fake_keyring = types.ModuleType("keyring")
+        fake_keyring.get_password = lambda service, key: store.get((service, key))
+        fake_keyring.set_password = lambda service, key, pw: store.__setitem__((service, key), pw)
+
+        def delete_password(service, key):
+            if (service, key) not in store:
+                raise PasswordDeleteError(key)
+            del store[(service, key)]
+
+        fake_keyring.delete_password = delete_password
+        fake_errors = types.ModuleType("keyring.errors")
+        fake_errors.KeyringError = KeyringError
+        fake_errors.PasswordDeleteError = PasswordDeleteError
+        monkeypatch.setitem(sys.modules, "keyring", fake_keyring)
+        monkeypatch.setitem(sys.modules, "keyring.errors", fake_errors)
+
+        prompts = []
+
+        def fake_getpass(prompt):
+            prompts.append(prompt)
+            return "secret"
+
+        monkeypatch.setattr(getpass, "getpass", fake_getpass)
+
+        with AVPCredentialProvider(vault_path, password_cache="keyring") as provider:
+            provider.set("file_key", "file_value")
+        assert list(store.values()) == ["secret"]
+
+        provider = AVPCredentialProvider(vault_path, password_cache="keyring")
+        assert provider.get("file_key") == "file_value"
+        assert len(prompts) == 1
+
+        provider.close(forget_password=True)
+        assert store == {}
+        provider.forget_password()
+
+        def no_keyring(*args):
+            raise NoKeyringError("no backend")
+
+        fake_keyring.get_password = no_keyring
+        fake_keyring.set_password = no_keyring
+        fake_keyring.delete_password = no_keyring
+        with AVPCredentialProvider(vault_path, password_cache="keyring") as provider:
+            assert provider.get("file_key") == "file_value"
+        assert len(prompts) == 2
+        provider.close(forget_password=True)
+
+    def test_slots(self):
+        """Test the provider does not carry a per-instance __dict__."""
+        provider = AVPCredentialProvider()
+        assert not hasattr(provider, "__dict__")
+        provider.close()
+
+    def test_get_strict(self):
+        """Test strict mode raises errors other than a missing credential."""
+        provider = AVPCredentialProvider()
+
+        def failing_retrieve(*args, **kwargs):
+            raise BackendError("backend down")
+
+        provider._client.retrieve = failing_retrieve
+        assert provider.get("any_key", default="fallback") == "fallback"
+        with pytest.raises(BackendError):
+            provider.get("any_key", strict=True)
+
+        provider.close()
+
+    def test_get_strict_missing(self):
+        """Test strict mode still returns the default for missing credentials."""
+        provider = AVPCredentialProvider()
+        assert provider.get("nonexistent", default="fallback", strict=True) == "fallback"
+        provider.close()
@@ -0,0 +1,99 @@
+"""Tests for LangChain-AVP utility functions."""
+
+import os
+import sys
+
+import pytest
+from langchain_avp import AVPCredentialProvider, get_llm_with_avp, load_credentials
+from langchain_avp import utils
+
+
+class FakeChatAnthropic:
+    """Stand-in for langchain_anthropic.ChatAnthropic."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+@pytest.fixture
+def fake_anthropic(monkeypatch):
+    monkeypatch.setattr(utils, "_anthropic_cls", lambda: FakeChatAnthropic)
+
+
+class TestGetLLMWithAVP:
+    """Test suite for get_llm_with_avp."""
+
+    def test_anthropic(self, fake_anthropic):
+        """Test the provider constructor receives the vault API key."""
+        provider = AVPCredentialProvider()
+        provider.set("anthropic_api_key", "sk-ant-test")
+
+        llm = get_llm_with_avp("Anthropic", provider, temperature=0)
+        assert isinstance(llm, FakeChatAnthropic)
+        assert llm.kwargs == {
+            "api_key": "sk-ant-test",
+            "model": "claude-3-haiku-20240307",
+            "temperature": 0,
+        }
+
+        llm = get_llm_with_avp("anthropic", provider, model="claude-3-opus")
+        assert llm.kwargs["model"] == "claude-3-opus"
+
+        provider.close()
+
+    def test_unknown_provider(self):
+        """Test unknown providers are rejected."""
+        provider = AVPCredentialProvider()
+        provider.set("acme_api_key", "key")
+
+        with pytest.raises(ValueError, match="Unknown provider: acme"):
+            get_llm_with_avp("acme", provider)
+
+        provider.close()
+
+    def test_missing_integration_package(self, monkeypatch):
+        """Test a missing integration package raises an install hint."""
+        monkeypatch.setitem(sys.modules, "langchain_mistralai", None)
+        utils._mistral_cls.cache_clear()
+        provider = AVPCredentialProvider()
+        provider.set("mistral_api_key", "key")
+
+        with pytest.raises(ImportError, match="pip install langchain-mistralai"):
+            get_llm_with_avp("mistral", provider)
+
+        provider.close()
+
+    def test_missing_api_key(self):
+        """Test a missing API key is reported."""
+        provider = AVPCredentialProvider()
+
+        with pytest.raises(ValueError, match="No API key found"):
+            get_llm_with_avp("anthropic", provider)
+
+        provider.close()
+
+
+class TestLoadCredentials:
+    """Test suite for load_credentials."""
+
+    def test_env_vars(self, tmp_path, monkeypatch):
+        """Test credentials are exported to environment variables."""
+        vault_path = str(tmp_path / "vault.enc")
+        with AVPCredentialProvider(vault_path, password="secret") as provider:
+            provider.set("anthropic_api_key", "sk-ant-test")
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+        credentials = load_credentials(
+            vault_path,
+            password="secret",
+            env_vars={
+                "ANTHROPIC_API_KEY": "anthropic_api_key",
+                "OPENAI_API_KEY": "openai_api_key",
+            },
+        )
+        assert os.environ["ANTHROPIC_API_KEY"] == "sk-ant-test"
+        assert "OPENAI_API_KEY" not in os.environ
+
+        credentials.close()